@@ -547,8 +547,8 @@ class MultipleTasks:
                 tasks = random.sample(tasks, k=len(tasks))
             if self.concurrent:
                 pool_class = multiprocessing.pool.ThreadPool if self.scheduler == "thread" else (multiprocessing.Pool if self.scheduler == "process" else None)
+                pool = pool_class(multiprocessing.cpu_count())
                 try:
-                    pool = pool_class(multiprocessing.cpu_count())
                     partially_applied_function = functools.partial(run_task_with_capturing_output, tasks=tasks, task_count=task_count, **dict(kwargs, keyboard_interrupt_handler=None))
                     map_results = pool.map_async(partially_applied_function, tasks, chunksize=self.chunksize)
                     task_results = map_results.get(0xFFFF)
@@ -556,6 +556,10 @@ class MultipleTasks:
                     for task in tasks:
                         task.set_cancel(True)
                     task_results = map_results.get(0xFFFF)
+                finally:
+                    # reap the worker processes/threads, they would otherwise accumulate across batch runs
+                    pool.close()
+                    pool.join()
             else:
                 keyboard_interrupt_handler = KeyboardInterruptHandler()
                 with DisabledKeyboardInterrupts(keyboard_interrupt_handler):
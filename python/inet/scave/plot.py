@@ -84,6 +84,28 @@ def add_global_style_if_needed(global_style, style):
         style.update(global_style)
         logger.debug(f'added. "style" dict: {style}')
 
+def _plot_df_rows(p, df, props, legend_cols, legend_func, global_style):
+    # shared row plotting loop of plot_vectors() and plot_vectors_separate_grouped() with the
+    # loop invariants resolved once up front
+    has_additional_style = 'additional_style' in df.columns
+    for t in df.itertuples(index=False):
+        style = utils._make_line_args(props, t, df)
+        logger.debug(f"orig style: {style}")
+        add_global_style_if_needed(global_style, style)
+        logger.debug(f"style after adding global_style: {style}")
+        if has_additional_style and t.additional_style != None:
+            add_additional_style(style, t.additional_style)
+        logger.debug(f"style: {style}")
+        p.plot(t.vectime, t.vecvalue, label=legend_func(legend_cols, t, props), **style)
+
+def add_additional_style(style, additional_style):
+    # the 'additional_style' column normally holds real dicts (see add_to_dataframe()), but charts
+    # that fill the column directly may still provide the styles as strings
+    if isinstance(additional_style, str):
+        additional_style = ast.literal_eval(additional_style)
+    logger.debug(f'adding additional style: {additional_style}')
+    style.update(additional_style)
+
 def plot_vectors(df, props, legend_func=utils.make_legend_label, global_style=None, custom_cycle=None):
     """
     Modified version of the built-in plot_vectors() function, with the additional functionality
@@ -141,22 +163,9 @@ def plot_vectors(df, props, legend_func=utils.make_legend_label, global_style=No
         df.sort_values(by='order', inplace=True)
     else:
         df.sort_values(by=legend_cols, inplace=True)
-    for t in df.itertuples(index=False):
-        style = utils._make_line_args(props, t, df)
-        logger.debug(f"orig style: {style}")
-        add_global_style_if_needed(global_style, style)
-        logger.debug(f"style after adding global_style: {style}")
-#        if t.propertyname != '':
-#            style[t.propertyname] = t.propertyvalue
-        if 'additional_style' in df.columns and t.additional_style != None:
-            style_dict = eval(t.additional_style)
-            logger.debug(f"style_dict: {style_dict}")
-            for i in style_dict.items():
-                style[i[0]] = i[1]
-        logger.debug(f"style: {style}")
-        if custom_cycle is not None:
-            plt.rc('axes', prop_cycle=custom_cycle)
-        p.plot(t.vectime, t.vecvalue, label=legend_func(legend_cols, t, props), **style)
+    if custom_cycle is not None:
+        plt.rc('axes', prop_cycle=custom_cycle)
+    _plot_df_rows(p, df, props, legend_cols, legend_func, global_style)
 
     title = get_prop("title") or utils.make_chart_title(df, title_cols)
     utils.set_plot_title(title)
@@ -198,9 +207,7 @@ def plot_vectors_separate(df, props, legend_func=utils.make_legend_label, global
         style = utils._make_line_args(props, t, df)
         add_global_style_if_needed(global_style, style)
         if 'additional_style' in df.columns and t.additional_style != None:
-            style_dict = eval(t.additional_style)
-            for j in style_dict.items():
-                style[j[0]] = j[1]
+            add_additional_style(style, t.additional_style)
         if share_axes == 'x':
             share_ax_dict = {'sharex': ax}
         elif share_axes == 'y':
@@ -256,13 +263,13 @@ def plot_vectors_separate_grouped(df_list, props, legend_func=utils.make_legend_
     ax_list = []
     
     props['plot_function'] = inspect.currentframe().f_code.co_name
-    
+
+    def get_prop(k):
+        return props[k] if k in props else None
+
     for j in range(0, len(df_list)):
         df = df_list[j]
 
-        def get_prop(k):
-            return props[k] if k in props else None
-    
         title_cols, legend_cols = utils.extract_label_columns(df, props)
         
         cols = 0
@@ -320,16 +327,9 @@ def plot_vectors_separate_grouped(df_list, props, legend_func=utils.make_legend_
             df.sort_values(by='order', inplace=True)
         else:
             df.sort_values(by=legend_cols, inplace=True)
-            
-        for t in df.itertuples(index=False):
-            style = utils._make_line_args(props, t, df)
-            add_global_style_if_needed(global_style, style)
-            if 'additional_style' in df.columns and t.additional_style != None:
-                style_dict = eval(t.additional_style)
-                for i in style_dict.items():
-                    style[i[0]] = i[1]
-            p.plot(t.vectime, t.vecvalue, label=legend_func(legend_cols, t, props), **style)
-        
+
+        _plot_df_rows(p, df, props, legend_cols, legend_func, global_style)
+
         if j == 0:
             title = get_prop("title") or utils.make_chart_title(df, title_cols)
 
@@ -472,9 +472,7 @@ def plot_vectors_separate_faded(df, props, legend_func=utils.make_legend_label,
             style = utils._make_line_args(props, t, df)
             add_global_style_if_needed(global_style, style)
             if 'additional_style' in df.columns and t.additional_style != None:
-                style_dict = eval(t.additional_style)
-                for i in style_dict.items():
-                    style[i[0]] = i[1]
+                add_additional_style(style, t.additional_style)
             label = ""
             if z != j:
                 c = mpl.colors.ColorConverter.to_rgb(style['color'])
@@ -686,68 +684,48 @@ def add_to_dataframe(df, style_tuple_list=None, default_dict=None, order=None):
     
     df['additional_style'] = None
     
-    if default_dict is not None:    
-        for i in range(0,len(df)):
-#            if (df.loc[i, 'additional_style'] == None):
-            logger.debug('adding default stuff')
-            df.loc[i, 'additional_style'] = str(default_dict)
-            
+    if default_dict is not None:
+        logger.debug('adding default stuff')
+        # each row gets its own copy so that later style tuples can merge in place without aliasing
+        df['additional_style'] = [dict(default_dict) for i in range(0, len(df))]
+
     if style_tuple_list is not None:
         for i in style_tuple_list:
             column = i[0]
             value = i[1]
             style_tuple = i[2]
-            
-            for i in range(0,len(df)):
-                pattern = re.compile(value)
-                logger.debug(f"value: {value}, pattern: {pattern}, df.loc[i, column] {df.loc[i, column]}")
-                match = re.fullmatch(pattern, df.loc[i, column])
-                logger.debug(f"match: {match}")
-                if match != None:
-                    # if debug:
-                    #     print("MATCH FOUND:")
-                    #     print("    column:", column)
-                    #     print("    value:", value)
-                    #     print("    match:", match.group())
-                    logger.debug(f"MATCH FOUND:\n    column: {column}\n    value: {value}\n    match: {match.group()}")
-                    if (df.loc[i, 'additional_style'] == None):
-                        df.loc[i, 'additional_style'] = str(style_tuple)
-                        logger.debug(f"Adding style tuple: {str(style_tuple)}\n")
-                    else:
-                        orig_style_dict = ast.literal_eval(df.loc[i, 'additional_style'])       # convert already added style to dict
-                        logger.debug(f"Adding style tuple to existing style dict {orig_style_dict}, {type(orig_style_dict)}")
-                        orig_style_dict.update(style_tuple)                                 # add new style to dict
-                        logger.debug(f"New style dict {orig_style_dict}, {type(orig_style_dict)}")
-                        # if debug: add_separator()
-                        # df.loc[i, 'additional_style'] = str(orig_style_dict)                    # add to dataframe as string
-                        df.loc[i, 'additional_style'] = str(orig_style_dict)
-            
+
+            # match all rows at once instead of invoking the regex engine row by row
+            mask = df[column].astype(str).str.fullmatch(value)
+            logger.debug(f"column: {column}, value: {value}, matching rows: {list(df.index[mask])}")
+            for j in df.index[mask]:
+                orig_style_dict = df.at[j, 'additional_style']
+                if orig_style_dict is None:
+                    df.at[j, 'additional_style'] = dict(style_tuple)
+                    logger.debug(f"Adding style tuple: {style_tuple}\n")
+                else:
+                    logger.debug(f"Adding style tuple to existing style dict {orig_style_dict}, {type(orig_style_dict)}")
+                    orig_style_dict.update(style_tuple)                                 # add new style to dict
+                    logger.debug(f"New style dict {orig_style_dict}, {type(orig_style_dict)}")
+
     if order is not None:
         # order the dataframe
         df['order'] = None
-        
+
         if type(order[1]) is dict:
             order_column = order[0]
             order_dict = order[1]
             logger.debug(f'order_column: {order_column}, order_dict {order_dict}')
             for i in order_dict.items():
-                for j in range(0,len(df)):
-                    # if df.loc[j, order_column] == i[0]:
-                    pattern = re.compile(i[0])
-                    match = re.fullmatch(pattern, df.loc[j, order_column])
-                    if match != None:
-                        df.loc[j, 'order'] = i[1]
+                mask = df[order_column].astype(str).str.fullmatch(i[0])
+                df.loc[mask, 'order'] = i[1]
         else:
             order_column = order[0]
             order_list = order[1:]
             logger.debug(f'order_column: {order_column}, order_list {order_list}')
             for order in range(0, len(order_list)):
-                for j in range(0,len(df)):
-                    # if df.loc[j, order_column] == i[0]:
-                    pattern = re.compile(order_list[order])
-                    match = re.fullmatch(pattern, df.loc[j, order_column])
-                    if match != None:
-                        df.loc[j, 'order'] = order
+                mask = df[order_column].astype(str).str.fullmatch(order_list[order])
+                df.loc[mask, 'order'] = order
 
                     
         # if debug: 
@@ -1156,12 +1134,9 @@ def plot_lines(df, props, legend_func=utils.make_legend_label, use_default_sort_
         if len(t.x) < 2 and style["marker"] == ' ':
             style["marker"] = '.'
             
-        if 'additional_style' in df.columns:
+        if 'additional_style' in df.columns and t.additional_style != None:
             logger.debug(f"t.additional_style: {t.additional_style}")
-            style_dict = eval(t.additional_style)
-            # print("style_dict:", style_dict)
-            for i in style_dict.items():
-                style[i[0]] = i[1]
+            add_additional_style(style, t.additional_style)
 
         p.plot(t.x, t.y, label=legend_func(legend_cols, t, props), **style)
 
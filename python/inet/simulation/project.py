@@ -12,6 +12,7 @@ one above the current working directory when the omnetpp.repl package is loaded,
 later.
 """
 
+import functools
 import glob
 import hashlib
 import json
@@ -197,18 +198,25 @@ class SimulationProject:
             raise Exception("Not implemented")
         return hasher.digest()
 
+    @functools.lru_cache(maxsize=None)
     def get_env(self):
+        # one shared copy per project is enough, subprocess only reads the dict passed as env
         return os.environ.copy()
 
+    # NOTE these path computations are memoized because they are called repeatedly with the same arguments
+    # when thousands of simulation tasks are run
+    @functools.lru_cache(maxsize=None)
     def get_environment_variable_relative_path(self, enviroment_variable, path):
         return os.path.abspath(os.path.join(os.environ[enviroment_variable], path)) if enviroment_variable in os.environ else None
 
+    @functools.lru_cache(maxsize=None)
     def get_full_path(self, path):
         return os.path.abspath(os.path.join(self.get_environment_variable_relative_path(self.folder_environment_variable, self.folder), path))
 
     def get_relative_path(self, path):
         return os.path.relpath(path, self.get_environment_variable_relative_path(self.folder_environment_variable, self.folder))
 
+    @functools.lru_cache(maxsize=None)
     def get_executable(self, mode="release"):
         dynamic_loading = self.build_types[0] == "dynamic library"
         executable_environment_variable = "__omnetpp_root_dir" if dynamic_loading else self.folder_environment_variable
@@ -256,11 +264,13 @@ class SimulationProject:
     def get_full_path_args(self, option, paths):
         return self.get_multiple_args(option, map(self.get_full_path, paths))
 
+    @functools.lru_cache(maxsize=None)
     def get_default_args(self):
         return [*self.get_full_path_args("-l", self.get_dynamic_libraries_for_running()), *self.get_full_path_args("-n", self.get_ned_folders_for_running()), *self.get_multiple_args("-x", self.ned_exclusions or self.get_ned_exclusions()), *self.get_full_path_args("--image-path", self.image_folders)]
 
     def get_ned_exclusions(self):
-        return [s.strip() for s in open(self.get_full_path(".nedexclusions")).readlines()]
+        with open(self.get_full_path(".nedexclusions")) as file:
+            return [s.strip() for s in file]
 
     def get_direct_include_folders(self):
         return list(map(lambda include_folder: self.get_full_path(include_folder), self.include_folders))
@@ -15,4 +15,5 @@ class SubprocessSimulationRunner:
         working_directory = simulation_config.working_directory
         full_working_directory = simulation_project.get_full_path(working_directory)
         _logger.debug(f"Running subprocess: {args}")
-        return subprocess.run(args, cwd=full_working_directory, capture_output=capture_output, env=simulation_project.get_env())
+        # detach the children from the parent's stdin so that concurrent simulations can never block on it
+        return subprocess.run(args, cwd=full_working_directory, stdin=subprocess.DEVNULL, capture_output=capture_output, env=simulation_project.get_env())
@@ -23,6 +23,21 @@ from inet.simulation.subprocess import *
 
 _logger = logging.getLogger(__name__)
 
+# compiled once at module load to avoid repeated regex compilation on the hot path when many simulation tasks complete
+_RE_TIME_LIMIT = re.compile(r"<!> Simulation time limit reached -- at t=(.*), event #(\d+)")
+_RE_ERROR_IN_MODULE = re.compile(r"<!> Error: (.*) -- in module (.*)")
+_RE_ERROR = re.compile(r"<!> Error: (.*)")
+
+def _search_output_line(pattern, output, marker):
+    # searches the single-line pattern in the line containing the last occurrence of the marker,
+    # avoiding decoding and scanning the potentially large subprocess output as a whole
+    index = output.rfind(marker)
+    if index == -1:
+        return None
+    end = output.find(b"\n", index)
+    line = output[index:end if end != -1 else len(output)]
+    return pattern.search(line.decode("utf-8", errors="replace"))
+
 # TODO: the task result depends on the following:
 #
 # 1. Binary distribution
@@ -68,22 +83,24 @@ class SimulationTaskResult(TaskResult):
         self.kwargs = kwargs
         self.subprocess_result = subprocess_result
         if subprocess_result:
-            stdout = self.subprocess_result.stdout.decode("utf-8") if self.subprocess_result.stdout else ""
-            stderr = self.subprocess_result.stderr.decode("utf-8") if self.subprocess_result.stderr else ""
-            match = re.search(r"<!> Simulation time limit reached -- at t=(.*), event #(\d+)", stdout)
+            # operate on the raw bytes and decode only the interesting lines, avoiding a full UTF-8 decode
+            # of the potentially tens of MB large stdout/stderr buffers
+            stdout = self.subprocess_result.stdout or b""
+            stderr = self.subprocess_result.stderr or b""
+            match = _search_output_line(_RE_TIME_LIMIT, stdout, b"<!> Simulation time limit reached")
             self.last_event_number = int(match.group(2)) if match else None
             self.last_simulation_time = match.group(1) if match else None
             self.elapsed_cpu_time = None # TODO
-            match = re.search("<!> Error: (.*) -- in module (.*)", stderr)
+            match = _search_output_line(_RE_ERROR_IN_MODULE, stderr, b"<!> Error:")
             self.error_message = match.group(1).strip() if match else None
             self.error_module = match.group(2).strip() if match else None
-            matching_lines = [re.sub("CREATE (.*)", "\\1", line) for line in stdout.split("\n") if re.search("inet\.", line)]
+            matching_lines = [re.sub("CREATE (.*)", "\\1", line.decode("utf-8")) for line in stdout.split(b"\n") if b"inet." in line]
             self.used_types = sorted(list(set(matching_lines)))
             if self.error_message is None:
-                match = re.search("<!> Error: (.*)", stderr)
+                match = _search_output_line(_RE_ERROR, stderr, b"<!> Error:")
                 self.error_message = match.group(1).strip() if match else None
             if self.error_message:
-                if re.search("The simulation attempted to prompt for user input", self.error_message):
+                if "The simulation attempted to prompt for user input" in self.error_message:
                     self.result = "SKIP"
                     self.color = COLOR_CYAN
                     self.expected_result = "SKIP"
@@ -213,10 +230,19 @@ class SimulationTask(Task):
             default_args = simulation_project.get_default_args()
             args = [executable, *default_args, "-s", "-u", "Cmdenv", "-f", simulation_config.ini_file, "-c", simulation_config.config, "-r", "0", "--sim-time-limit", "0s"]
             _logger.debug(f"Running subprocess: {args}")
-            subprocess_result = subprocess.run(args, cwd=simulation_project.get_full_path(simulation_config.working_directory), capture_output=True, env=simulation_project.get_env())
-            stderr = subprocess_result.stderr.decode("utf-8")
-            match = re.search(r"The simulation wanted to ask a question|The simulation attempted to prompt for user input", stderr)
-            self.interactive = match is not None
+            # scan the stderr stream line by line instead of buffering it completely, and stop the
+            # subprocess as soon as one of the known prompt messages appears
+            process = subprocess.Popen(args, cwd=simulation_project.get_full_path(simulation_config.working_directory), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=simulation_project.get_env())
+            self.interactive = False
+            try:
+                for line in process.stderr:
+                    if b"The simulation wanted to ask a question" in line or b"The simulation attempted to prompt for user input" in line:
+                        self.interactive = True
+                        process.terminate()
+                        break
+            finally:
+                process.stderr.close()
+                process.wait()
         return self.interactive
 
     def get_expected_result(self):
@@ -9,11 +9,11 @@ GitHub repository.
 """
 
 import filecmp
+import functools
 import io
 import logging
 import matplotlib
 import numpy
-import sewar
 
 import omnetpp
 import omnetpp.scave
@@ -26,6 +26,11 @@ from inet.test.task import *
 
 _logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
+def _load_anf_file(analysis_file_path):
+    # analysis files are loaded once per chart otherwise, both when the tasks are collected and when they are run
+    return omnetpp.scave.analysis.load_anf_file(analysis_file_path)
+
 class ChartTestTask(TestTask):
     def __init__(self, analysis_file_name, id, chart_name, simulation_project=None, name="chart test", **kwargs):
         super().__init__(name=name, **kwargs)
@@ -42,34 +47,41 @@ class ChartTestTask(TestTask):
 
     def run_protected(self, keep_charts=True, output_stream=sys.stdout, **kwargs):
         workspace = omnetpp.scave.analysis.Workspace(get_workspace_path("."), [])
-        analysis = omnetpp.scave.analysis.load_anf_file(self.simulation_project.get_full_path(self.analysis_file_name))
-        for chart in analysis.collect_charts():
-            if chart.id == self.id:
-                image_export_filename = chart.properties["image_export_filename"]
-                if image_export_filename is None or image_export_filename == "":
-                    return self.task_result_class(self, result="SKIP", expected_result="SKIP", reason="Chart file name is not specified")
-                folder = os.path.dirname(self.simulation_project.get_full_path(self.analysis_file_name))
-                file_name = analysis.export_image(chart, folder, workspace, format="png", dpi=150, target_folder=self.simulation_project.media_folder, filename=image_export_filename + "-new")
-                new_file_name = os.path.join(folder, file_name)
-                old_file_name = os.path.join(folder, re.sub("-new\.png$", ".png", file_name))
-                diff_file_name = os.path.join(folder, re.sub("-new\.png$", "-diff.png", file_name))
-                if os.path.exists(diff_file_name):
-                    os.remove(diff_file_name)
-                if os.path.exists(old_file_name):
-                    new_image = matplotlib.image.imread(new_file_name)
-                    old_image = matplotlib.image.imread(old_file_name)
-                    metric = sewar.rmse(old_image, new_image)
-                    if metric == 0 or not keep_charts:
-                        os.remove(new_file_name)
-                    else:
-                        image_diff = numpy.abs(new_image - old_image)
-                        matplotlib.image.imsave(diff_file_name, image_diff[:, :, :3])
-                    result = "PASS" if metric == 0 else "FAIL"
-                    reason = "Metric: " + str(metric) if result == "FAIL" else None
-                    return self.task_result_class(self, result=result, reason=reason)
-                else:
-                    return self.task_result_class(self, result="FAIL", reason="Baseline chart not found")
-        return self.task_result_class(self, result="ERROR", reason="Chart not found")
+        analysis = _load_anf_file(self.simulation_project.get_full_path(self.analysis_file_name))
+        # stop at the first matching chart instead of enumerating all charts of the analysis
+        chart = next((chart for chart in analysis.collect_charts() if chart.id == self.id), None)
+        if chart is None:
+            return self.task_result_class(self, result="ERROR", reason="Chart not found")
+        image_export_filename = chart.properties["image_export_filename"]
+        if image_export_filename is None or image_export_filename == "":
+            return self.task_result_class(self, result="SKIP", expected_result="SKIP", reason="Chart file name is not specified")
+        folder = os.path.dirname(self.simulation_project.get_full_path(self.analysis_file_name))
+        file_name = analysis.export_image(chart, folder, workspace, format="png", dpi=150, target_folder=self.simulation_project.media_folder, filename=image_export_filename + "-new")
+        base_file_name = file_name[:-len("-new.png")] # export_image appends the "-new" suffix and the ".png" extension
+        new_file_name = os.path.join(folder, file_name)
+        old_file_name = os.path.join(folder, base_file_name + ".png")
+        diff_file_name = os.path.join(folder, base_file_name + "-diff.png")
+        if os.path.exists(diff_file_name):
+            os.remove(diff_file_name)
+        if os.path.exists(old_file_name):
+            # bytewise equality is the common passing case and is much cheaper than decoding and diffing the images
+            if filecmp.cmp(old_file_name, new_file_name, shallow=False):
+                metric = 0
+            else:
+                new_image = matplotlib.image.imread(new_file_name)
+                old_image = matplotlib.image.imread(old_file_name)
+                image_difference = old_image.astype(numpy.float32) - new_image.astype(numpy.float32)
+                metric = float(numpy.sqrt(numpy.mean(image_difference * image_difference)))
+            if metric == 0 or not keep_charts:
+                os.remove(new_file_name)
+            else:
+                image_diff = numpy.abs(new_image - old_image)
+                matplotlib.image.imsave(diff_file_name, image_diff[:, :, :3])
+            result = "PASS" if metric == 0 else "FAIL"
+            reason = "Metric: " + str(metric) if result == "FAIL" else None
+            return self.task_result_class(self, result=result, reason=reason)
+        else:
+            return self.task_result_class(self, result="FAIL", reason="Baseline chart not found")
 
 def get_chart_test_sim_time_limit(simulation_config, run=0):
     return simulation_config.sim_time_limit
@@ -103,8 +115,9 @@ def get_chart_test_tasks(simulation_project=None, run_simulations=True, filter=N
         simulation_project = get_default_simulation_project()
     test_tasks = []
     simulation_tasks = []
+    seen_simulation_tasks = set()
     for analysis_file_name in get_analysis_files(simulation_project=simulation_project, filter=filter or working_directory_filter, **kwargs):
-        analysis = omnetpp.scave.analysis.load_anf_file(simulation_project.get_full_path(analysis_file_name))
+        analysis = _load_anf_file(simulation_project.get_full_path(analysis_file_name))
         for chart in analysis.collect_charts():
             if matches_filter(chart.name, chart_filter, exclude_chart_filter, False):
                 folder = os.path.dirname(simulation_project.get_full_path(analysis_file_name))
@@ -112,7 +125,9 @@ def get_chart_test_tasks(simulation_project=None, run_simulations=True, filter=N
                 multiple_simulation_tasks = get_simulation_tasks(simulation_project=simulation_project, working_directory_filter=working_directory, sim_time_limit=get_chart_test_sim_time_limit, **kwargs)
                 if run_simulations:
                     for simulation_task in multiple_simulation_tasks.tasks:
-                        if not list(builtins.filter(lambda element: element.simulation_config == simulation_task.simulation_config and element.run_number == simulation_task.run_number, simulation_tasks)):
+                        simulation_task_key = (id(simulation_task.simulation_config), simulation_task.run_number)
+                        if simulation_task_key not in seen_simulation_tasks:
+                            seen_simulation_tasks.add(simulation_task_key)
                             simulation_tasks.append(simulation_task)
                 if multiple_simulation_tasks.tasks:
                     test_tasks.append(ChartTestTask(simulation_project=simulation_project, analysis_file_name=analysis_file_name, id=chart.id, chart_name=chart.name, task_result_class=TestTaskResult))
@@ -148,38 +163,45 @@ class ChartUpdateTask(UpdateTask):
 
     def run_protected(self, keep_charts=True, **kwargs):
         workspace = omnetpp.scave.analysis.Workspace(get_workspace_path("."), [])
-        analysis = omnetpp.scave.analysis.load_anf_file(self.simulation_project.get_full_path(self.analysis_file_name))
-        for chart in analysis.collect_charts():
-            if chart.id == self.id:
-                image_export_filename = chart.properties["image_export_filename"]
-                if image_export_filename is None or image_export_filename == "":
-                    return self.task_result_class(self, result="SKIP", expected_result="SKIP", reason="Chart file name is not specified")
-                folder = os.path.dirname(self.simulation_project.get_full_path(self.analysis_file_name))
-                file_name = analysis.export_image(chart, folder, workspace, format="png", dpi=150, target_folder=self.simulation_project.media_folder, filename=image_export_filename + "-new")
-                new_file_name = os.path.join(folder, file_name)
-                old_file_name = os.path.join(folder, re.sub("-new\.png$", ".png", file_name))
-                diff_file_name = os.path.join(folder, re.sub("-new\.png$", "-diff.png", file_name))
-                if os.path.exists(diff_file_name):
-                    os.remove(diff_file_name)
-                if os.path.exists(old_file_name):
-                    new_image = matplotlib.image.imread(new_file_name)
-                    old_image = matplotlib.image.imread(old_file_name)
-                    metric = sewar.rmse(old_image, new_image)
-                    if metric == 0:
-                        os.remove(new_file_name)
-                    else:
-                        if keep_charts:
-                            os.rename(old_file_name, re.sub("-new\.png$", "-old.png", file_name))
-                            image_diff = numpy.abs(new_image - old_image)
-                            matplotlib.image.imsave(diff_file_name, image_diff[:, :, :3])
-                        else:
-                            os.remove(old_file_name)
-                        os.rename(new_file_name, old_file_name)
-                    return self.task_result_class(self, result="KEEP" if metric == 0 else "UPDATE")
+        analysis = _load_anf_file(self.simulation_project.get_full_path(self.analysis_file_name))
+        # stop at the first matching chart instead of enumerating all charts of the analysis
+        chart = next((chart for chart in analysis.collect_charts() if chart.id == self.id), None)
+        if chart is None:
+            return self.task_result_class(self, result="ERROR", reason="Chart not found")
+        image_export_filename = chart.properties["image_export_filename"]
+        if image_export_filename is None or image_export_filename == "":
+            return self.task_result_class(self, result="SKIP", expected_result="SKIP", reason="Chart file name is not specified")
+        folder = os.path.dirname(self.simulation_project.get_full_path(self.analysis_file_name))
+        file_name = analysis.export_image(chart, folder, workspace, format="png", dpi=150, target_folder=self.simulation_project.media_folder, filename=image_export_filename + "-new")
+        base_file_name = file_name[:-len("-new.png")] # export_image appends the "-new" suffix and the ".png" extension
+        new_file_name = os.path.join(folder, file_name)
+        old_file_name = os.path.join(folder, base_file_name + ".png")
+        diff_file_name = os.path.join(folder, base_file_name + "-diff.png")
+        if os.path.exists(diff_file_name):
+            os.remove(diff_file_name)
+        if os.path.exists(old_file_name):
+            # bytewise equality is the common case and is much cheaper than decoding and diffing the images
+            if filecmp.cmp(old_file_name, new_file_name, shallow=False):
+                metric = 0
+            else:
+                new_image = matplotlib.image.imread(new_file_name)
+                old_image = matplotlib.image.imread(old_file_name)
+                image_difference = old_image.astype(numpy.float32) - new_image.astype(numpy.float32)
+                metric = float(numpy.sqrt(numpy.mean(image_difference * image_difference)))
+            if metric == 0:
+                os.remove(new_file_name)
+            else:
+                if keep_charts:
+                    os.rename(old_file_name, base_file_name + "-old.png")
+                    image_diff = numpy.abs(new_image - old_image)
+                    matplotlib.image.imsave(diff_file_name, image_diff[:, :, :3])
                 else:
-                    os.rename(new_file_name, old_file_name)
-                    return self.task_result_class(self, result="INSERT")
-        return self.task_result_class(self, result="ERROR", reason="Chart not found")
+                    os.remove(old_file_name)
+                os.rename(new_file_name, old_file_name)
+            return self.task_result_class(self, result="KEEP" if metric == 0 else "UPDATE")
+        else:
+            os.rename(new_file_name, old_file_name)
+            return self.task_result_class(self, result="INSERT")
 
 class MultipleChartUpdateTasks(MultipleUpdateTasks):
     def __init__(self, multiple_simulation_tasks=None, name="chart update", multiple_task_results_class=MultipleUpdateTaskResults, **kwargs):
@@ -210,8 +232,9 @@ def get_update_chart_tasks(simulation_project=None, run_simulations=True, filter
         simulation_project = get_default_simulation_project()
     update_tasks = []
     simulation_tasks = []
+    seen_simulation_tasks = set()
     for analysis_file_name in get_analysis_files(simulation_project=simulation_project, filter=filter or working_directory_filter, **kwargs):
-        analysis = omnetpp.scave.analysis.load_anf_file(simulation_project.get_full_path(analysis_file_name))
+        analysis = _load_anf_file(simulation_project.get_full_path(analysis_file_name))
         for chart in analysis.collect_charts():
             if matches_filter(chart.name, chart_filter, exclude_chart_filter, False):
                 folder = os.path.dirname(simulation_project.get_full_path(analysis_file_name))
@@ -219,7 +242,9 @@ def get_update_chart_tasks(simulation_project=None, run_simulations=True, filter
                 if run_simulations:
                     multiple_simulation_tasks = get_simulation_tasks(simulation_project=simulation_project, working_directory_filter=working_directory, sim_time_limit=get_chart_test_sim_time_limit, **kwargs)
                     for simulation_task in multiple_simulation_tasks.tasks:
-                        if not list(builtins.filter(lambda element: element.simulation_config == simulation_task.simulation_config and element.run_number == simulation_task.run_number, simulation_tasks)):
+                        simulation_task_key = (id(simulation_task.simulation_config), simulation_task.run_number)
+                        if simulation_task_key not in seen_simulation_tasks:
+                            seen_simulation_tasks.add(simulation_task_key)
                             simulation_tasks.append(simulation_task)
                 update_tasks.append(ChartUpdateTask(simulation_project=simulation_project, analysis_file_name=analysis_file_name, id=chart.id, chart_name=chart.name, task_result_class=UpdateTaskResult))
     return MultipleChartUpdateTasks(tasks=update_tasks, multiple_simulation_tasks=MultipleSimulationTasks(tasks=simulation_tasks, simulation_project=simulation_project, **kwargs), **dict(kwargs, scheduler="process"))
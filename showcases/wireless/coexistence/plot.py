@@ -0,0 +1,45 @@
+"""
+Plots the SNIRs of receptions dumped into snirs.txt while running the coexistence showcase.
+
+Each line of snirs.txt contains the comma-separated SNIR values of one reception, with
+52 OFDM subcarriers per time division. Receptions with a frequency-dependent SNIR are
+displayed as a 3D scatter plot of time division, subcarrier and SNIR.
+"""
+
+import hashlib
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+prevhash = None
+
+with open("snirs.txt", "rt") as f:
+    # iterate the file lazily instead of materializing all lines with readlines()
+    for l in f:
+        # parse the comma-separated SNIR values of the line with a single NumPy call
+        nums = np.fromstring(l, sep=",", dtype=np.float64)
+        if len(nums) == 0:
+            continue
+        if np.isnan(nums).any():
+            print("NaN")
+            np.nan_to_num(nums, copy=False, nan=0.0)
+        # skip receptions identical to the previous one; hashing the raw bytes avoids keeping
+        # and comparing a full copy of the previous array
+        numshash = hashlib.blake2b(nums.tobytes(), digest_size=16).digest()
+        if numshash == prevhash:
+            continue
+        prevhash = numshash
+        # skip receptions where the SNIR doesn't change along frequency, they are not interesting in 3D
+        timeDivisions = int(len(nums) / 52)
+        tiles = nums[:timeDivisions * 52].reshape(-1, 52)
+        freqHomogeneous = bool(np.all(tiles == tiles[:, :1]))
+        if freqHomogeneous:
+            continue
+        x, y = np.meshgrid(np.arange(52), np.arange(timeDivisions))
+        fig = plt.figure()
+        ax = fig.add_subplot(projection="3d")
+        ax.scatter(x.flatten(), y.flatten(), nums[:timeDivisions * 52])
+        ax.set_xlabel("subcarrier")
+        ax.set_ylabel("time division")
+        ax.set_zlabel("SNIR")
+        plt.show()